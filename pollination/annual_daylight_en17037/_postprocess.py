@@ -1,5 +1,4 @@
 from pollination_dsl.dag import Inputs, GroupedDAG, task, Outputs
-from dataclasses import dataclass
 from pollination.honeybee_radiance_postprocess.post_process import AnnualDaylightEn17037Metrics
 from pollination.honeybee_radiance_postprocess.post_process import AnnualDaylightMetrics
 from pollination.honeybee_radiance_postprocess.post_process import GridSummaryMetrics
@@ -9,15 +8,8 @@ from pollination.alias.inputs.radiancepar import daylight_thresholds_input
 from pollination.alias.inputs.schedule import schedule_csv_input
 
 
-@dataclass
-class AnnualDaylightEN17037PostProcess(GroupedDAG):
-    """Annual daylight EN17037 post-process."""
-
-    # inputs
-    model = Inputs.file(
-        description='Input Honeybee model.',
-        extensions=['json', 'hbjson', 'pkl', 'hbpkl', 'zip']
-    )
+class _PostProcessInputs:
+    """Inputs shared by the post-process grouped DAGs."""
 
     results = Inputs.folder(
         description='Annual daylight results folder.'
@@ -29,6 +21,35 @@ class AnnualDaylightEN17037PostProcess(GroupedDAG):
         extensions=['txt', 'csv'], optional=True, alias=schedule_csv_input
     )
 
+
+class AnnualDaylightEN17037PostProcess(_PostProcessInputs, GroupedDAG):
+    """Annual daylight EN17037 post-process."""
+
+    @task(template=AnnualDaylightEn17037Metrics)
+    def calculate_annual_metrics_en17037(
+        self, folder=_PostProcessInputs.results, schedule=_PostProcessInputs.schedule
+    ):
+        return [
+            {
+                'from': AnnualDaylightEn17037Metrics()._outputs.annual_en17037_metrics,
+                'to': 'en17037'
+            }
+        ]
+
+    en17037 = Outputs.folder(
+        source='en17037', description='Annual daylight EN17037 metrics folder.'
+    )
+
+
+class AnnualDaylightMetricsPostProcess(_PostProcessInputs, GroupedDAG):
+    """Annual daylight metrics post-process."""
+
+    # inputs
+    model = Inputs.file(
+        description='Input Honeybee model.',
+        extensions=['json', 'hbjson', 'pkl', 'hbpkl', 'zip']
+    )
+
     thresholds = Inputs.str(
         description='A string to change the threshold for daylight autonomy and useful '
         'daylight illuminance. Valid keys are -t for daylight autonomy threshold, -lt '
@@ -37,6 +58,7 @@ class AnnualDaylightEN17037PostProcess(GroupedDAG):
         'not important and you can include one or all of them. For instance if you only '
         'want to change the upper threshold to 2000 lux you should use -ut 2000 as '
         'the input.', default='-t 300 -lt 100 -ut 3000',
+        spec={'type': 'string', 'pattern': r'^\s*(-(t|lt|ut)\s+\d+\s*)+$'},
         alias=daylight_thresholds_input
     )
 
@@ -45,20 +67,10 @@ class AnnualDaylightEN17037PostProcess(GroupedDAG):
         path='grid_metrics.json', optional=True
     )
 
-    @task(template=AnnualDaylightEn17037Metrics)
-    def calculate_annual_metrics_en17037(
-        self, folder=results, schedule=schedule
-    ):
-        return [
-            {
-                'from': AnnualDaylightEn17037Metrics()._outputs.annual_en17037_metrics,
-                'to': 'en17037'
-            }
-        ]
-
     @task(template=AnnualDaylightMetrics)
     def calculate_annual_metrics(
-        self, folder=results, schedule=schedule, thresholds=thresholds
+        self, folder=_PostProcessInputs.results, schedule=_PostProcessInputs.schedule,
+        thresholds=thresholds
     ):
         return [
             {
@@ -83,10 +95,6 @@ class AnnualDaylightEN17037PostProcess(GroupedDAG):
             }
         ]
 
-    en17037 = Outputs.folder(
-        source='en17037', description='Annual daylight EN17037 metrics folder.'
-    )
-
     metrics = Outputs.folder(
         source='metrics', description='Annual daylight metrics folder. These '
         'metrics are the usual annual daylight metrics with the daylight '
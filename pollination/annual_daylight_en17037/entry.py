@@ -1,6 +1,7 @@
 from pollination_dsl.dag import Inputs, DAG, task, Outputs
-from dataclasses import dataclass
 from pollination.two_phase_daylight_coefficient import TwoPhaseDaylightCoefficientEntryPoint
+from pollination.honeybee_radiance.schedule import EPWtoDaylightHours
+from pollination.ladybug.translate import EpwToWea
 
 # input/output alias
 from pollination.alias.inputs.model import hbjson_model_grid_input
@@ -14,11 +15,10 @@ from pollination.alias.outputs.daylight import daylight_autonomy_results, \
     continuous_daylight_autonomy_results, udi_results, udi_lower_results, \
     udi_upper_results, grid_metrics_results
 
-from ._process_epw import AnnualDaylightEN17037ProcessEPW
-from ._postprocess import AnnualDaylightEN17037PostProcess
+from ._postprocess import AnnualDaylightEN17037PostProcess, \
+    AnnualDaylightMetricsPostProcess
 
 
-@dataclass
 class AnnualDaylightEN17037EntryPoint(DAG):
     """Annual daylight EN17037 entry point."""
 
@@ -86,6 +86,7 @@ class AnnualDaylightEN17037EntryPoint(DAG):
         'not important and you can include one or all of them. For instance if you only '
         'want to change the upper threshold to 2000 lux you should use -ut 2000 as '
         'the input.', default='-t 300 -lt 100 -ut 3000',
+        spec={'type': 'string', 'pattern': r'^\s*(-(t|lt|ut)\s+\d+\s*)+$'},
         alias=daylight_thresholds_input
     )
 
@@ -94,52 +95,78 @@ class AnnualDaylightEN17037EntryPoint(DAG):
         extensions=['json'], optional=True, alias=grid_metrics_input
     )
 
-    @task(template=AnnualDaylightEN17037ProcessEPW)
-    def annual_metrics_en17037_process_epw(
+    @task(template=EPWtoDaylightHours, annotations={'cpu': '1', 'memory': '1Gi'})
+    def create_daylight_hours(
         self, epw=epw
     ):
         return [
             {
-                'from': AnnualDaylightEN17037ProcessEPW()._outputs.wea,
-                'to': 'wea.wea'
-            },
-            {
-                'from': AnnualDaylightEN17037ProcessEPW()._outputs.daylight_hours,
+                'from': EPWtoDaylightHours()._outputs.daylight_hours_csv,
                 'to': 'daylight_hours.csv'
             }
         ]
 
+    @task(template=EpwToWea, annotations={'cpu': '1', 'memory': '1Gi'})
+    def create_wea(
+        self, epw=epw
+    ):
+        return [
+            {
+                'from': EpwToWea()._outputs.wea,
+                'to': 'wea.wea'
+            }
+        ]
+
     @task(
         template=TwoPhaseDaylightCoefficientEntryPoint,
-        needs=[annual_metrics_en17037_process_epw]
+        needs=[create_wea]
     )
     def run_two_phase_daylight_coefficient(
             self, north=north, cpu_count=cpu_count, min_sensor_count=min_sensor_count,
             radiance_parameters=radiance_parameters, grid_filter=grid_filter,
-            model=model, wea=annual_metrics_en17037_process_epw._outputs.wea
+            model=model, wea=create_wea._outputs.wea
     ):
-        pass
+        return [
+            {
+                'from': TwoPhaseDaylightCoefficientEntryPoint()._outputs.results,
+                'to': 'results'
+            }
+        ]
 
     @task(
         template=AnnualDaylightEN17037PostProcess,
-        needs=[annual_metrics_en17037_process_epw, run_two_phase_daylight_coefficient]
+        needs=[create_daylight_hours, run_two_phase_daylight_coefficient],
+        annotations={'cpu': '1'}
     )
-    def annual_metrics_en17037_postprocess(
-        self, results='results',
-        schedule=annual_metrics_en17037_process_epw._outputs.daylight_hours,
-        thresholds=thresholds, model=model, grid_metrics=grid_metrics
+    def postprocess_en17037(
+        self, results=run_two_phase_daylight_coefficient._outputs.results,
+        schedule=create_daylight_hours._outputs.daylight_hours_csv
     ):
         return [
             {
                 'from': AnnualDaylightEN17037PostProcess()._outputs.en17037,
                 'to': 'en17037'
-            },
+            }
+        ]
+
+    @task(
+        template=AnnualDaylightMetricsPostProcess,
+        needs=[create_daylight_hours, run_two_phase_daylight_coefficient],
+        annotations={'cpu': '1'}
+    )
+    def postprocess_metrics(
+        self, results=run_two_phase_daylight_coefficient._outputs.results,
+        schedule=create_daylight_hours._outputs.daylight_hours_csv,
+        thresholds=thresholds, model=model, grid_metrics=grid_metrics
+    ):
+        template = AnnualDaylightMetricsPostProcess()
+        return [
             {
-                'from': AnnualDaylightEN17037PostProcess()._outputs.metrics,
+                'from': template._outputs.metrics,
                 'to': 'metrics'
             },
             {
-                'from': AnnualDaylightEN17037PostProcess()._outputs.grid_summary,
+                'from': template._outputs.grid_summary,
                 'to': 'grid_summary.csv'
             }
         ]